@@ -31,11 +31,11 @@ class DelayManager(MpfController):
 
     def __init__(self, machine: "MachineController") -> None:
         """Initialise delay manager."""
-        self.delays = {}        # type: Dict[str, Tuple[Any, Callable]]
+        self.delays = {}        # type: Dict[Union[str, int, uuid.UUID], Tuple[Any, Callable]]
         super().__init__(machine)
 
-    def add(self, ms: int, callback: Callable[..., None], name: str = None,
-            **kwargs) -> str:
+    def add(self, ms: int, callback: Callable[..., None], name: Union[str, int, uuid.UUID] = None,
+            **kwargs) -> Union[str, int, uuid.UUID]:
         """Add a delay.
 
         Args:
@@ -69,7 +69,7 @@ class DelayManager(MpfController):
 
         return name
 
-    def remove(self, name: str):
+    def remove(self, name: Union[str, int, uuid.UUID]):
         """Remove a delay by name.
 
         Removing a delay prevents the callback from being called and cancels
@@ -118,8 +118,8 @@ class DelayManager(MpfController):
         """
         return delay in self.delays
 
-    def reset(self, ms: int, callback: Callable[..., None], name: Union[str, uuid.UUID],
-              **kwargs) -> str:
+    def reset(self, ms: int, callback: Callable[..., None], name: Union[str, int, uuid.UUID],
+              **kwargs) -> Union[str, int, uuid.UUID]:
         """Reset a delay.
 
         Resetting will first delete the existing delay (if it exists) and then
@@ -173,7 +173,7 @@ class DelayManager(MpfController):
             except KeyError:
                 pass
 
-    def _process_delay_callback(self, name: str, callback: Callable[..., None], **kwargs):
+    def _process_delay_callback(self, name: Union[str, int, uuid.UUID], callback: Callable[..., None], **kwargs):
         # Process the delay callback and run the event queue afterwards
         self.debug_log("---Processing delay: %s", name)
         try:
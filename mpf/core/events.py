@@ -7,7 +7,7 @@ import asyncio
 from functools import partial, lru_cache
 from unittest.mock import MagicMock
 
-from typing import Dict, Any, Tuple, Optional, Callable, List
+from typing import Dict, Any, Tuple, Optional, Callable, List, Iterable
 
 from mpf.core.mpf_controller import MpfController
 
@@ -454,6 +454,19 @@ class EventManager(MpfController):
         """
         self._post(event, None, callback, **kwargs)
 
+    def post_many(self, events: Iterable[Tuple[str, dict]]) -> None:
+        """Post multiple events in order.
+
+        This is the same as calling post() for every event but saves the
+        overhead of one call per event. Every event gets its own copy of the
+        kwargs so the same dict can be passed for all events.
+
+        Args:
+            events: Iterable of (event, kwargs) tuples.
+        """
+        for event, kwargs in events:
+            self._post(event, None, None, **kwargs)
+
     def post_boolean(self, event: str, callback=None, **kwargs) -> None:
         """Post an boolean event which causes all the registered handlers to be called one-by-one.
 
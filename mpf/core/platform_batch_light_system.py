@@ -2,8 +2,7 @@
 import abc
 import asyncio
 
-from typing import Callable, Tuple, Set, List
-from sortedcontainers import SortedSet, SortedList
+from typing import Callable, Tuple, Set, List, Dict
 from mpf.platforms.interfaces.light_platform_interface import LightPlatformInterface
 from mpf.core.utility_functions import Util
 
@@ -12,14 +11,14 @@ class PlatformBatchLight(LightPlatformInterface, abc.ABC):
 
     """Light which can be batched."""
 
-    __slots__ = ["light_system", "_current_fade", "_last_brightness"]
+    __slots__ = ["light_system", "_current_fade", "_cached_result"]
 
     def __init__(self, number, light_system: "PlatformBatchLightSystem"):
         """Initialise light."""
         super().__init__(number)
         self.light_system = light_system
         self._current_fade = (0, -1, 0, -1)
-        self._last_brightness = None
+        self._cached_result = None
 
     @abc.abstractmethod
     def get_max_fade_ms(self):
@@ -29,43 +28,46 @@ class PlatformBatchLight(LightPlatformInterface, abc.ABC):
         """Mark dirty and remember fade."""
         self.light_system.mark_dirty(self)
         self._current_fade = (start_brightness, start_time, target_brightness, target_time)
-        self._last_brightness = None
+        self._cached_result = None
 
     def get_fade_and_brightness(self, current_time):
         """Return fade + brightness and mark as clean if this is it."""
-        if self._last_brightness:
-            return self._last_brightness, 0, True
-        max_fade_ms = self.get_max_fade_ms()
+        result = self._cached_result
+        if result is not None:
+            # fade is done. also works for brightness 0
+            return result
         start_brightness, start_time, target_brightness, target_time = self._current_fade
         fade_ms = int((target_time - current_time) * 1000.0)
-        if fade_ms > max_fade_ms > 0:
-            fade_ms = max_fade_ms
-            ratio = ((current_time + (fade_ms / 1000.0) - start_time) /
-                     (target_time - start_time))
-            brightness = start_brightness + (target_brightness - start_brightness) * ratio
-            done = False
+        if fade_ms > 0:
+            # only ask the platform for its max fade if there is a fade left
+            max_fade_ms = self.get_max_fade_ms()
+            if fade_ms > max_fade_ms > 0:
+                ratio = ((current_time + (max_fade_ms / 1000.0) - start_time) /
+                         (target_time - start_time))
+                brightness = start_brightness + (target_brightness - start_brightness) * ratio
+                return brightness, max_fade_ms, False
         else:
-            if fade_ms < 0:
-                fade_ms = 0
-            brightness = target_brightness
-            self._last_brightness = brightness
-            done = True
+            fade_ms = 0
 
-        return brightness, fade_ms, done
+        self._cached_result = (target_brightness, 0, True)
+        return target_brightness, fade_ms, True
 
 
 class PlatformBatchLightSystem:
 
     """Batch light system for platforms."""
 
-    __slots__ = ["dirty_lights", "dirty_schedule", "clock", "is_sequential_function", "update_task", "update_callback",
-                 "sort_function", "update_hz", "max_batch_size"]
+    __slots__ = ["dirty_lights", "clock", "is_sequential_function", "update_task", "update_callback",
+                 "sort_function", "update_hz", "max_batch_size", "_scheduled", "_scheduled_by_due_time",
+                 "_wakeup"]
 
     # pylint: disable-msg=too-many-arguments
     def __init__(self, clock, sort_function, is_sequential_function, update_callback, update_hz, max_batch_size):
         """Initialise light system."""
-        self.dirty_lights = SortedSet(key=sort_function)    # type: Set[PlatformBatchLight]
-        self.dirty_schedule = SortedList(key=lambda x: x[0] + sort_function(x[1]))
+        self.dirty_lights = set()   # type: Set[PlatformBatchLight]
+        # [due_time, timer_handle, lights]. all lights due at the same time share one entry and one loop timer
+        self._scheduled = {}                # type: Dict[PlatformBatchLight, list]
+        self._scheduled_by_due_time = {}    # type: Dict[float, list]
         self.is_sequential_function = is_sequential_function
         self.sort_function = sort_function
         self.update_task = None
@@ -73,6 +75,7 @@ class PlatformBatchLightSystem:
         self.update_callback = update_callback
         self.update_hz = update_hz
         self.max_batch_size = max_batch_size
+        self._wakeup = asyncio.Event(loop=clock.loop)
 
     def start(self):
         """Start light system."""
@@ -85,58 +88,100 @@ class PlatformBatchLightSystem:
             self.update_task.cancel()
             self.update_task = None
 
+        for _, timer, _ in self._scheduled_by_due_time.values():
+            timer.cancel()
+        self._scheduled_by_due_time = {}
+        self._scheduled = {}
+
     async def _send_updates(self):
+        is_sequential = self.is_sequential_function
+        send_update_batch = self._send_update_batch
         while True:
-            while self.dirty_schedule and self.dirty_schedule[0][0] <= self.clock.get_time():
-                self.dirty_lights.add(self.dirty_schedule[0][1])
-                del self.dirty_schedule[0]
+            self._wakeup.clear()
+
+            # sort once per pass. clear before sending so lights marked dirty meanwhile are kept for the next pass
+            dirty_lights = sorted(self.dirty_lights, key=self.sort_function)
+            self.dirty_lights.clear()
 
             sequential_lights = []
-            for light in list(self.dirty_lights):
+            for light in dirty_lights:
                 if not sequential_lights:
                     # first light
                     sequential_lights = [light]
-                elif self.is_sequential_function(sequential_lights[-1], light):
+                elif is_sequential(sequential_lights[-1], light):
                     # lights are sequential
                     sequential_lights.append(light)
                 else:
                     # sequence ended
-                    await self._send_update_batch(sequential_lights)
+                    await send_update_batch(sequential_lights)
                     # this light is a new sequence
                     sequential_lights = [light]
 
             if sequential_lights:
-                await self._send_update_batch(sequential_lights)
-
-            self.dirty_lights.clear()
+                await send_update_batch(sequential_lights)
 
-            await asyncio.sleep(.001, loop=self.clock.loop)
+            # sleep until a light is marked dirty (or a scheduled light is due)
+            await self._wakeup.wait()
 
     async def _send_update_batch(self, sequential_lights):
         sequential_brightness_list = []     # type: List[Tuple[LightPlatformInterface, float, int]]
+        append = sequential_brightness_list.append
         common_fade_ms = None
-        current_time = self.clock.get_time()
+        get_time = self.clock.get_time
+        update_callback = self.update_callback
+        max_batch_size = self.max_batch_size
+        schedule = self._schedule
+        current_time = get_time()
         for light in sequential_lights:
             brightness, fade_ms, done = light.get_fade_and_brightness(current_time)
             if not done:
-                self.dirty_schedule.add((current_time + (fade_ms / 1000), light))
+                schedule(light, current_time + (fade_ms / 1000))
             if common_fade_ms is None:
                 common_fade_ms = fade_ms
 
-            if common_fade_ms == fade_ms and len(sequential_brightness_list) < self.max_batch_size:
-                sequential_brightness_list.append((light, brightness, common_fade_ms))
+            if common_fade_ms == fade_ms and len(sequential_brightness_list) < max_batch_size:
+                append((light, brightness, common_fade_ms))
             else:
-                await self.update_callback(sequential_brightness_list)
+                await update_callback(sequential_brightness_list)
                 # start new list
-                current_time = self.clock.get_time()
+                current_time = get_time()
                 common_fade_ms = fade_ms
                 sequential_brightness_list = [(light, brightness, common_fade_ms)]
+                append = sequential_brightness_list.append
 
         if sequential_brightness_list:
-            await self.update_callback(sequential_brightness_list)
+            await update_callback(sequential_brightness_list)
+
+    def _schedule(self, light: "PlatformBatchLight", due_time: float):
+        """Schedule light to become dirty again at due_time."""
+        self._unschedule(light)
+        entry = self._scheduled_by_due_time.get(due_time)
+        if entry is None:
+            entry = [due_time, self.clock.loop.call_at(due_time, self._schedule_due, due_time), set()]
+            self._scheduled_by_due_time[due_time] = entry
+        entry[2].add(light)
+        self._scheduled[light] = entry
+
+    def _schedule_due(self, due_time: float):
+        """Mark all lights scheduled for due_time dirty."""
+        _, _, lights = self._scheduled_by_due_time.pop(due_time)
+        for light in lights:
+            del self._scheduled[light]
+        self.dirty_lights.update(lights)
+        self._wakeup.set()
 
     def mark_dirty(self, light: "PlatformBatchLight"):
         """Mark as dirty."""
         self.dirty_lights.add(light)
-        self.dirty_schedule = SortedList([x for x in self.dirty_schedule if x[1] != light],
-                                         key=lambda x: x[0] + self.sort_function(x[1]))
+        self._wakeup.set()
+        self._unschedule(light)
+
+    def _unschedule(self, light: "PlatformBatchLight"):
+        """Cancel pending schedule for light."""
+        entry = self._scheduled.pop(light, None)
+        if entry:
+            due_time, timer, lights = entry
+            lights.discard(light)
+            if not lights:
+                timer.cancel()
+                del self._scheduled_by_due_time[due_time]
@@ -1,6 +1,5 @@
 """A shot in MPF."""
-import uuid
-from collections import namedtuple
+from collections import namedtuple, deque
 from typing import List, Dict, Set
 
 import mpf.core.delays
@@ -10,6 +9,10 @@ from mpf.core.player import Player
 from mpf.core.mode_device import ModeDevice
 from mpf.core.system_wide_device import SystemWideDevice
 
+MYPY = False
+if MYPY:   # pragma: no cover
+    from typing import Deque    # pylint: disable-msg=cyclic-import,unused-import
+
 ActiveSequence = namedtuple("ActiveSequence", ["id", "current_position_index", "next_event"])
 
 
@@ -21,18 +24,22 @@ class SequenceShot(SystemWideDevice, ModeDevice):
     collection = 'sequence_shots'
     class_label = 'sequence_shot'
 
-    __slots__ = ["delay", "active_sequences", "active_delays", "_sequence_events", "_delay_events"]
+    __slots__ = ["delay", "active_sequences", "active_delays", "_sequence_events", "_delay_events",
+                 "_sequence_counter", "_sequences_waiting_for"]
 
     def __init__(self, machine, name):
         """Initialise sequence shot."""
         super().__init__(machine, name)
 
         self.delay = mpf.core.delays.DelayManager(self.machine)
-        self.active_sequences = list()  # type: List[ActiveSequence]
+        self.active_sequences = {}      # type: Dict[int, ActiveSequence]
         self.active_delays = set()      # type: Set[str]
 
         self._sequence_events = []      # type: List[str]
         self._delay_events = {}         # type: Dict[str, int]
+        self._sequence_counter = 0
+        # ids of active sequences by their next event. the longest waiting sequence comes first
+        self._sequences_waiting_for = {}    # type: Dict[str, Deque[int]]
 
     @property
     def can_exist_outside_of_game(self):
@@ -115,12 +122,11 @@ class SequenceShot(SystemWideDevice, ModeDevice):
         else:
             # Get the seq_id of the first sequence this switch is next for.
             # This is not a loop because we only want to advance 1 sequence
-            seq = next((x for x in self.active_sequences if
-                        x.next_event == event_name), None)
+            waiting = self._sequences_waiting_for.get(event_name)
 
-            if seq:
+            if waiting:
                 # advance this sequence
-                self._advance_sequence(seq)
+                self._advance_sequence(self.active_sequences[waiting.popleft()])
 
     def _start_new_sequence(self):
         # If the sequence hasn't started, make sure we're not within the
@@ -131,13 +137,15 @@ class SequenceShot(SystemWideDevice, ModeDevice):
                            self.active_delays)
             return
 
-        # create a new sequence
-        seq_id = uuid.uuid4()
+        # create a new sequence. ids only have to be unique within this shot
+        self._sequence_counter += 1
+        seq_id = self._sequence_counter
         next_event = self._sequence_events[1]
 
         self.debug_log("Setting up a new sequence. Next: %s", next_event)
 
-        self.active_sequences.append(ActiveSequence(seq_id, 0, next_event))
+        self.active_sequences[seq_id] = ActiveSequence(seq_id, 0, next_event)
+        self._sequences_waiting_for.setdefault(next_event, deque()).append(seq_id)
 
         # if this sequence has a time limit, set that up
         if self.config['sequence_timeout']:
@@ -150,8 +158,8 @@ class SequenceShot(SystemWideDevice, ModeDevice):
                              seq_id=seq_id)
 
     def _advance_sequence(self, sequence: ActiveSequence):
-        # Remove this sequence from the list
-        self.active_sequences.remove(sequence)
+        # Remove this sequence from the list. the caller already removed it from the waiting list
+        del self.active_sequences[sequence.id]
 
         if sequence.current_position_index == (len(self._sequence_events) - 2):  # complete
 
@@ -166,7 +174,8 @@ class SequenceShot(SystemWideDevice, ModeDevice):
 
             self.debug_log("Advancing the sequence. Next: %s", next_event)
 
-            self.active_sequences.append(ActiveSequence(sequence.id, current_position_index, next_event))
+            self.active_sequences[sequence.id] = ActiveSequence(sequence.id, current_position_index, next_event)
+            self._sequences_waiting_for.setdefault(next_event, deque()).append(sequence.id)
 
     def _completed(self):
         """Post sequence complete event."""
@@ -183,12 +192,11 @@ class SequenceShot(SystemWideDevice, ModeDevice):
 
     def reset_all_sequences(self):
         """Reset all sequences."""
-        seq_ids = [x.id for x in self.active_sequences]
-
-        for seq_id in seq_ids:
+        for seq_id in self.active_sequences:
             self.delay.remove(seq_id)
 
-        self.active_sequences = list()
+        self.active_sequences.clear()
+        self._sequences_waiting_for.clear()
 
     def _delay_switch_hit(self, name, ms, **kwargs):
         del kwargs
@@ -207,7 +215,8 @@ class SequenceShot(SystemWideDevice, ModeDevice):
         """Sequence timeouted."""
         self.debug_log("Sequence %s timeouted", seq_id)
 
-        self.active_sequences = [x for x in self.active_sequences
-                                 if x[0] != seq_id]
+        sequence = self.active_sequences.pop(seq_id, None)
+        if sequence:
+            self._sequences_waiting_for[sequence.next_event].remove(seq_id)
 
         self.machine.events.post("{}_timeout".format(self.name))
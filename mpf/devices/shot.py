@@ -24,7 +24,9 @@ class Shot(EnableDisableMixin, ModeDevice):
     to track shots.
     """
 
-    __slots__ = ["delay", "active_sequences", "active_delays", "running_show", "_handlers"]
+    __slots__ = ["delay", "active_delays", "running_show", "_handlers", "_player_key",
+                 "_profile_states", "_profile_loop", "_profile_show", "_profile_name", "_hit_events",
+                 "_last_update_key"]
 
     def __init__(self, machine, name):
         """Initialise shot."""
@@ -34,11 +36,39 @@ class Shot(EnableDisableMixin, ModeDevice):
 
         self.delay = mpf.core.delays.DelayManager(self.machine)
 
-        self.active_sequences = list()
-        """List of tuples: (id, current_position_index, next_switch)"""
         self.active_delays = set()
         self.running_show = None
         self._handlers = []
+        self._player_key = "shot_{}".format(name)
+
+        # cached from the profile config when the shot is loaded in a mode
+        self._profile_states = []
+        self._profile_loop = False
+        self._profile_show = None
+        self._profile_name = None
+
+        # names of the events posted on hit indexed by state
+        self._hit_events = []
+
+        # (enabled, state, running show) after the last _update_show
+        self._last_update_key = None
+
+    def _load_profile(self):
+        """Cache settings of the profile.
+
+        The profile may be defined in another mode so its config is only complete once modes start.
+        """
+        profile_config = self.config['profile'].config
+        self._profile_states = profile_config['states']
+        self._profile_loop = profile_config['loop']
+        self._profile_show = profile_config['show']
+        self._profile_name = self.config['profile'].name
+
+        self._hit_events = [("{}_hit".format(self.name),
+                             "{}_{}_hit".format(self.name, self._profile_name),
+                             "{}_{}_{}_hit".format(self.name, self._profile_name, state['name']),
+                             "{}_{}_hit".format(self.name, state['name']))
+                            for state in self._profile_states]
 
     def device_loaded_in_mode(self, mode: Mode, player: Player):
         """Add device to a mode that was already started.
@@ -47,6 +77,9 @@ class Shot(EnableDisableMixin, ModeDevice):
         that's usually called when a player's turn starts since that was missed
         since the mode started after that.
         """
+        # before super() because enabling the shot will update the show
+        self._load_profile()
+        self._last_update_key = None
         super().device_loaded_in_mode(mode, player)
         self._update_show()
 
@@ -115,9 +148,9 @@ class Shot(EnableDisableMixin, ModeDevice):
         self.debug_log("Advancing 1 step. Profile: %s, "
                        "Current State: %s", profile_name, state)
 
-        if state + 1 >= len(self.config['profile'].config['states']):
+        if state + 1 >= len(self._profile_states):
 
-            if self.config['profile'].config['loop']:
+            if self._profile_loop:
                 self._set_state(0)
 
             else:
@@ -147,7 +180,7 @@ class Shot(EnableDisableMixin, ModeDevice):
         if not self.player:
             # no player no state
             return "None"
-        return self.config['profile'].config['states'][self._get_state()]['name']
+        return self._profile_states[self._get_state()]['name']
 
     @property
     def state(self):
@@ -167,38 +200,48 @@ class Shot(EnableDisableMixin, ModeDevice):
     def _get_state(self):
         if not self.player:
             return 0
-        return self.player["shot_{}".format(self.name)]
+        return self.player[self._player_key]
 
     def _set_state(self, state):
-        old = self.player["shot_{}".format(self.name)]
+        old = self.player[self._player_key]
         old_name = self.state_name
-        self.player["shot_{}".format(self.name)] = state
+        self.player[self._player_key] = state
+        self._last_update_key = None
         self.notify_virtual_change("state", old, state)
         self.notify_virtual_change("state_name", old_name, self.state_name)
 
-    def _get_profile_settings(self):
-        state = self._get_state()
-        return self.profile.config['states'][state]
+    def _get_update_key(self, enabled, state):
+        running_show = self.running_show
+        if running_show and running_show.stopped:
+            running_show = None
+        return enabled, state, running_show
 
     def _update_show(self):
-        if not self.enabled and not self.profile.config['show_when_disabled']:
-            self._stop_show()
+        enabled = self.enabled
+        state = self._get_state()
+        if self._last_update_key == self._get_update_key(enabled, state):
+            # nothing changed since the last update
             return
 
-        state = self._get_state()
-        state_settings = self.profile.config['states'][state]
+        if not enabled and not self.profile.config['show_when_disabled']:
+            self._stop_show()
 
-        if state_settings['show']:  # there's a show specified this state
-            self._play_show(settings=state_settings)
+        else:
+            state_settings = self._profile_states[state]
 
-        elif self.profile.config['show']:
-            # no show for this state, but we have a profile root show
-            self._play_show(settings=state_settings, start_step=state + 1)
+            if state_settings['show']:  # there's a show specified this state
+                self._play_show(settings=state_settings)
 
-        # if neither if/elif above happens, it means the current step has no
-        # show but the previous step had one. We stop the previous show if there is one
-        elif self.running_show:
-            self._stop_show()
+            elif self._profile_show:
+                # no show for this state, but we have a profile root show
+                self._play_show(settings=state_settings, start_step=state + 1)
+
+            # if neither if/elif above happens, it means the current step has no
+            # show but the previous step had one. We stop the previous show if there is one
+            elif self.running_show:
+                self._stop_show()
+
+        self._last_update_key = self._get_update_key(enabled, state)
 
     def _play_show(self, settings, start_step=None):
         manual_advance = settings['manual_advance']
@@ -207,23 +250,21 @@ class Shot(EnableDisableMixin, ModeDevice):
             if settings['manual_advance'] is None:
                 manual_advance = False
         else:
-            show_name = self.profile.config['show']
+            show_name = self._profile_show
             if settings['manual_advance'] is None:
                 manual_advance = True
 
-        if settings['show_tokens'] and self.config['show_tokens']:
-            show_tokens = dict(settings['show_tokens'])
-            show_tokens.update(self.config['show_tokens'])
-        elif settings['show_tokens']:
-            show_tokens = settings['show_tokens']
-        elif self.config['show_tokens']:
-            show_tokens = self.config['show_tokens']
+        # evaluate tokens while merging them. tokens of the shot override the ones of the profile state
+        shot_tokens = self.config['show_tokens']
+        if settings['show_tokens']:
+            show_tokens = {k: v.evaluate({}) for k, v in settings['show_tokens'].items()
+                           if not shot_tokens or k not in shot_tokens}
         else:
             show_tokens = {}
 
-        if show_tokens:
-            show_tokens = {k: v.evaluate({})
-                           for k, v in show_tokens.items()}
+        if shot_tokens:
+            for k, v in shot_tokens.items():
+                show_tokens[k] = v.evaluate({})
 
         priority = settings['priority'] + self.mode.priority
         if not start_step:
@@ -290,15 +331,17 @@ class Shot(EnableDisableMixin, ModeDevice):
         if self.active_delays:
             return False
 
-        profile_settings = self._get_profile_settings()
+        state_index = self._get_state()
+        profile_settings = self._profile_states[state_index]
 
         if not profile_settings:
             return False
 
         state = profile_settings['name']
+        profile_name = self._profile_name
 
         self.debug_log("Hit! Profile: %s, State: %s",
-                       self.profile_name, state)
+                       profile_name, state)
 
         if self.profile.config['advance_on_hit']:
             self.debug_log("Advancing shot because advance_on_hit is True.")
@@ -307,10 +350,10 @@ class Shot(EnableDisableMixin, ModeDevice):
             self.debug_log('Not advancing shot')
             advancing = False
 
-        self._notify_monitors(self.config['profile'].name, state)
+        self._notify_monitors(profile_name, state)
 
-        self.machine.events.post('{}_hit'.format(self.name),
-                                 profile=self.profile_name, state=state, advancing=advancing)
+        kwargs = {"profile": profile_name, "state": state, "advancing": advancing}
+        self.machine.events.post_many((event, kwargs) for event in self._hit_events[state_index])
         '''event: (name)_hit
         desc: The shot called (name) was just hit.
 
@@ -322,8 +365,6 @@ class Shot(EnableDisableMixin, ModeDevice):
         profile: The name of the profile that was active when hit.
         state: The name of the state the profile was in when it was hit'''
 
-        self.machine.events.post('{}_{}_hit'.format(self.name, self.profile_name),
-                                 profile=self.profile_name, state=state, advancing=advancing)
         '''event: (name)_(profile)_hit
         desc: The shot called (name) was just hit with the profile (profile)
         active.
@@ -341,8 +382,6 @@ class Shot(EnableDisableMixin, ModeDevice):
         profile: The name of the profile that was active when hit.
         state: The name of the state the profile was in when it was hit'''
 
-        self.machine.events.post('{}_{}_{}_hit'.format(self.name, self.profile_name, state),
-                                 profile=self.profile_name, state=state, advancing=advancing)
         '''event: (name)_(profile)_(state)_hit
         desc: The shot called (name) was just hit with the profile (profile)
         active in the state (state).
@@ -360,8 +399,6 @@ class Shot(EnableDisableMixin, ModeDevice):
         profile: The name of the profile that was active when hit.
         state: The name of the state the profile was in when it was hit'''
 
-        self.machine.events.post('{}_{}_hit'.format(self.name, state),
-                                 profile=self.profile_name, state=state, advancing=advancing)
         '''event: (name)_(state)_hit
         desc: The shot called (name) was just hit while in the profile (state).
 
@@ -492,8 +492,7 @@ class LisyHardwarePlatform(SwitchPlatform, LightsPlatform, DriverPlatform,
 
         data = bytearray([sequential_brightness_list[0][0].number, int(fade_time / 255), int(fade_time & 0xFF),
                           len(sequential_brightness_list)])
-        for _, brightness, _ in sequential_brightness_list:
-            data.append(int(255 * brightness))
+        data.extend([int(255 * brightness) for _, brightness, _ in sequential_brightness_list])
 
         self.send_byte(LisyDefines.FadeModernLights, data)
 
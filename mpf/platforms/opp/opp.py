@@ -136,8 +136,7 @@ class OppHardwarePlatform(LightsPlatform, SwitchPlatform, DriverPlatform):
         msg.append(int(common_fade_ms / 256))
         msg.append(int(common_fade_ms % 256))
 
-        for _, brightness, _ in sequential_brightness_list:
-            msg.append(int(brightness * 255))
+        msg.extend([int(brightness * 255) for _, brightness, _ in sequential_brightness_list])
 
         msg.extend(OppRs232Intf.calc_crc8_whole_msg(msg))
         cmd = bytes(msg)
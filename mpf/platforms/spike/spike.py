@@ -449,8 +449,7 @@ class SpikePlatform(SwitchPlatform, LightsPlatform, DriverPlatform, DmdPlatform,
         fade_time = int(common_fade_ms * self.ticks_per_sec[sequential_brightness_list[0][0].node] / 1000)
 
         data = bytearray([fade_time])
-        for _, brightness, _ in sequential_brightness_list:
-            data.append(int(255 * brightness))
+        data.extend([int(255 * brightness) for _, brightness, _ in sequential_brightness_list])
 
         self.send_cmd_async(sequential_brightness_list[0][0].node,
                             SpikeNodebus.SetLed + sequential_brightness_list[0][0].index, data)
@@ -160,6 +160,22 @@ class TestEventManager(MpfFakeGameTestCase, MpfTestCase):
         self.assertEqual(tuple(), self._handler1_args)
         self.assertEqual({'test1': 'test1'}, self._handler1_kwargs)
 
+    def test_post_many(self):
+        # test that all events are posted in order and each handler gets the kwargs
+        self.machine.events.add_handler('test_event', self.event_handler1)
+        self.machine.events.add_handler('test_event2', self.event_handler2)
+        self.advance_time_and_run(1)
+
+        kwargs = {'test1': 'test1'}
+        self.machine.events.post_many([('test_event', kwargs), ('test_event2', kwargs)])
+        self.advance_time_and_run(1)
+
+        self.assertEqual(1, self._handler1_called)
+        self.assertEqual({'test1': 'test1'}, self._handler1_kwargs)
+        self.assertEqual(1, self._handler2_called)
+        self.assertEqual({'test1': 'test1'}, self._handler2_kwargs)
+        self.assertEqual([self.event_handler1, self.event_handler2], self._handlers_called)
+
     def test_event_with_callback(self):
         # test that a callback is called when the event is done
         self.machine.events.add_handler('test_event', self.event_handler1)
@@ -0,0 +1,99 @@
+"""Test batch light system."""
+import asyncio
+import unittest
+from unittest.mock import MagicMock
+
+from mpf.core.clock import ClockBase
+from mpf.core.platform_batch_light_system import PlatformBatchLight, PlatformBatchLightSystem
+from mpf.tests.loop import TimeTravelLoop
+
+
+class BatchLight(PlatformBatchLight):
+
+    """Batch light with a fixed max fade."""
+
+    def get_max_fade_ms(self):
+        """Return max fade ms."""
+        return 100
+
+    def get_board_name(self):
+        """Return board name."""
+        return "Test"
+
+
+class TestPlatformBatchLightSystem(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = TimeTravelLoop()
+        self.exceptions = []
+        self.loop.set_exception_handler(lambda loop, context: self.exceptions.append(context))
+        self.clock = ClockBase(loop=self.loop)
+        self.updates = []
+        self.light_system = PlatformBatchLightSystem(self.clock, lambda light: light.number,
+                                                     lambda light, other_light: False, self._update_callback,
+                                                     50, 10)
+        self.callback = None
+        self.light1 = BatchLight(1, self.light_system)
+        self.light2 = BatchLight(2, self.light_system)
+        self.light_system.start()
+
+    def tearDown(self):
+        self.light_system.stop()
+        self.loop.close()
+
+    async def _update_callback(self, sequential_brightness_list):
+        self.updates.append([(light.number, brightness, fade_ms)
+                             for light, brightness, fade_ms in sequential_brightness_list])
+        # sending takes some time
+        await asyncio.sleep(.01, loop=self.loop)
+        if self.callback:
+            callback = self.callback
+            self.callback = None
+            callback()
+
+    def advance_time_and_run(self, delta=1.0):
+        self.loop.run_until_complete(asyncio.sleep(delay=delta, loop=self.loop))
+
+    def test_fade_light_dirty_during_update(self):
+        def callback():
+            # light 2 has not been sent yet in this pass
+            self.light2.set_fade(0, self.clock.get_time(), 1, self.clock.get_time() + 1)
+
+        self.callback = callback
+        start_time = self.clock.get_time()
+        self.light1.set_fade(0, start_time, 1, start_time + 1)
+        self.light2.set_fade(0, start_time, 1, start_time + 1)
+        self.advance_time_and_run(.05)
+
+        # light 2 is only scheduled once
+        self.assertEqual(1, len([lights for _, _, lights in self.light_system._scheduled_by_due_time.values()
+                                 if self.light2 in lights]))
+
+        self.advance_time_and_run(2)
+        self.assertFalse(self.exceptions)
+        self.assertEqual((1, 0, True), self.light1.get_fade_and_brightness(self.clock.get_time()))
+        self.assertEqual((1, 0, True), self.light2.get_fade_and_brightness(self.clock.get_time()))
+        self.assertFalse(self.light_system._scheduled)
+        self.assertFalse(self.light_system._scheduled_by_due_time)
+
+    def test_dirty_during_update(self):
+        def callback():
+            self.light1.set_fade(1, -1, .5, -1)
+
+        self.callback = callback
+        self.light1.set_fade(0, -1, 1, -1)
+        self.advance_time_and_run(.1)
+        self.assertEqual([[(1, 1, 0)], [(1, .5, 0)]], self.updates)
+
+    def test_fade_to_off(self):
+        start_time = self.clock.get_time()
+        self.light1.set_fade(1, start_time, 0, start_time + .5)
+        self.advance_time_and_run(1)
+        # last update fades to off
+        self.assertEqual(0, self.updates[-1][0][1])
+
+        # finished fades are cached and do not ask the platform again
+        self.light1.get_max_fade_ms = MagicMock(return_value=100)
+        self.assertEqual((0, 0, True), self.light1.get_fade_and_brightness(self.clock.get_time()))
+        self.assertEqual((0, 0, True), self.light1.get_fade_and_brightness(self.clock.get_time() + 1))
+        self.light1.get_max_fade_ms.assert_not_called()
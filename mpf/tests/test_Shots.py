@@ -63,6 +63,9 @@ class TestShots(MpfTestCase):
         self.assertIn('shot_4', self.machine.shots)
         self.assertIn('led_1', self.machine.shots)
 
+        # all attributes of shots live in slots
+        self.assertFalse(hasattr(self.machine.shots["shot_1"], "__dict__"))
+
         self.assertFalse(self.machine.shots["mode1_shot_1"].enabled)
 
         self.start_game()
@@ -383,6 +386,59 @@ class TestShots(MpfTestCase):
         self.advance_time_and_run(1)
         self.assertLightColor("led_11", "antiquewhite")
 
+    def test_update_show_without_changes(self):
+        self.start_game()
+        shot = self.machine.shots["shot_11"]
+        running_show = shot.running_show
+        self.assertIsNotNone(running_show)
+
+        # nothing changed. keep the show
+        shot._update_show()
+        self.assertIs(running_show, shot.running_show)
+
+        # show got stopped from outside. start it again
+        running_show.stop()
+        shot._update_show()
+        self.assertIsNot(running_show, shot.running_show)
+        self.assertFalse(shot.running_show.stopped)
+
+    def test_single_state_loop(self):
+        self.start_game()
+        shot = self.machine.shots["shot_29"]
+        running_show = shot.running_show
+        self.assertFalse(running_show.stopped)
+        step = running_show.current_step_index
+
+        # loops back to the same state. the show keeps running
+        shot.advance()
+        self.advance_time_and_run(.1)
+        self.assertEqual("one", shot.state_name)
+        self.assertIs(running_show, shot.running_show)
+        self.assertEqual(step, running_show.current_step_index)
+
+        shot.disable()
+        self.advance_time_and_run(.1)
+        self.assertIsNone(shot.running_show)
+        self.assertLightColor("led_22", "off")
+
+        # advancing a disabled shot does not start the show
+        shot.advance()
+        self.advance_time_and_run(.1)
+        self.assertIsNone(shot.running_show)
+        self.assertLightColor("led_22", "off")
+
+        shot.enable()
+        self.advance_time_and_run(.1)
+        self.assertLightColor("led_22", "red")
+
+        # show got stopped from outside. advancing starts it again
+        shot.running_show.stop()
+        self.advance_time_and_run(.1)
+        shot.advance()
+        self.advance_time_and_run(.1)
+        self.assertFalse(shot.running_show.stopped)
+        self.assertLightColor("led_22", "red")
+
     def test_combined_show_in_profile_root_and_step(self):
         # tests a show defined in a profile root which is used for most steps,
         # but a separate show in certain steps that is used just for that step